@@ -1,11 +1,48 @@
 import pathlib
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
+from distutils.errors import CCompilerError, DistutilsExecError, DistutilsPlatformError
 
 
 HERE = pathlib.Path(__file__).parent
 with open('requirements.txt') as f:
     REQUIREMENTS = f.read().strip().split('\n')
 
+# The C extension is opt-in: it is only built if Cython is installed before building from source.
+try:
+    from Cython.Build import cythonize
+    EXT_MODULES = cythonize("snowfall/_snowfall_core.pyx")
+except ImportError:
+    EXT_MODULES = []
+
+BUILD_ERRORS = (CCompilerError, DistutilsExecError, DistutilsPlatformError, OSError)
+
+
+class OptionalBuildExt(build_ext):
+    """
+    Skips the C extension with a warning if it fails to build, e.g. without a C compiler, so that the install still
+    succeeds. Snowfall falls back to its pure Python implementation without it.
+    """
+
+    def run(self):
+        try:
+            super().run()
+        except BUILD_ERRORS as error:
+            self.warn(f"Skipping the optional C extension: {error}")
+
+    def build_extensions(self):
+        self.skipped_extensions = []
+        super().build_extensions()
+        # Skipped extensions have no outputs to copy in place or install.
+        self.extensions = [ext for ext in self.extensions if ext not in self.skipped_extensions]
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except BUILD_ERRORS as error:
+            self.warn(f"Skipping the optional C extension {ext.name}: {error}")
+            self.skipped_extensions.append(ext)
+
 setup(
     name="snowfall",
     version="1.0.7",
@@ -21,6 +58,8 @@ setup(
         "Programming Language :: Python :: 3.7",
     ],
     packages=find_packages(),
+    ext_modules=EXT_MODULES,
+    cmdclass={"build_ext": OptionalBuildExt},
     include_package_data=True,
     install_requires=REQUIREMENTS,
     entry_points={
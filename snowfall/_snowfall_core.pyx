@@ -0,0 +1,56 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C implementation of snowfall.looping_count_shard, built when Cython is available at install time.
+"""
+from threading import Lock
+
+# Mirrors the GUID spec in snowfall.main.Snowfall.
+cdef long long OFFSET_FOR_LOOPING_COUNT = 12
+cdef long long OFFSET_FOR_MS_SINCE_EPOCH = 23
+
+
+cdef class LoopingCountShard:
+
+    cdef public object lock
+    cdef public long long looping_counter
+    cdef public long long guid_last_generated_at
+    cdef public long long generator_id
+    cdef readonly long long first_looping_count
+    cdef readonly long long max_looping_count
+
+    def __init__(
+            self,
+            long long generator_id,
+            long long first_looping_count,
+            long long looping_counts_per_shard
+    ):
+        """
+        See snowfall.looping_count_shard.LoopingCountShard.
+        """
+        self.lock = Lock()
+        self.looping_counter = 0
+        self.guid_last_generated_at = -1
+        self.generator_id = generator_id
+        self.first_looping_count = first_looping_count
+        self.max_looping_count = looping_counts_per_shard - 1
+
+    cpdef object compose_guid(self, long long ms_since_epoch):
+        """
+        See snowfall.looping_count_shard.LoopingCountShard.compose_guid. GUIDs are composed as unsigned 64 bit
+        integers, as ms_since_epoch reaches the sign bit after 2^40ms.
+        """
+        if ms_since_epoch < 0:
+            raise ValueError(f"ms_since_epoch: {ms_since_epoch} cannot be negative.")
+        elif self.guid_last_generated_at != ms_since_epoch:
+            self.guid_last_generated_at = ms_since_epoch
+            self.looping_counter = 0
+        elif self.looping_counter < self.max_looping_count:
+            self.looping_counter += 1
+        else:
+            return None
+
+        return (
+            (<unsigned long long> ms_since_epoch << OFFSET_FOR_MS_SINCE_EPOCH)
+            | (<unsigned long long> (self.first_looping_count + self.looping_counter) << OFFSET_FOR_LOOPING_COUNT)
+            | <unsigned long long> self.generator_id
+        )
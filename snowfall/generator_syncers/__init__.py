@@ -1,3 +1,4 @@
 from snowfall.generator_syncers.abstracts import BaseSyncer
 from snowfall.generator_syncers.database_syncer import DatabaseSyncer
 from snowfall.generator_syncers.simple_syncer import SimpleSyncer
+from snowfall.generator_syncers.shared_process_syncer import SharedProcessSyncer
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Callable
 from apscheduler.schedulers.background import BackgroundScheduler
+import atexit
 import logging
+import os
 
 from snowfall.utils import get_current_timestamp_ms
 
@@ -10,35 +14,93 @@ class BaseSyncer(ABC):
     PROBE_MISSES_TO_RELEASE = 2
     MAX_GENERATOR_ID = 2 ** 12 - 1
 
+    scheduler = BackgroundScheduler()
+    _scheduler_lock = Lock()
+
     def __init__(self):
         """
         All syncers have a background task which updates the liveliness of its Snowfall instance in the manifest
-        at periodic intervals
+        at periodic intervals. The tasks of all syncers in a process share a single scheduler thread.
         """
         logging.info("Initializing generator syncer base class with liveliness scheduler")
         self._last_alive_ms = 0
+        self._generator_id_listeners = []
         self._generator_id = self._claim_generator_id()
+        self._schedule_liveliness_job()
+        self._start_scheduler()
 
-        self.scheduler = BackgroundScheduler()
+    def _schedule_liveliness_job(self) -> None:
+        """
+        Adds the job that periodically updates the liveliness of this syncer to the shared scheduler.
+        """
         self.scheduler.add_job(
             func=self.update_liveliness_job,
             trigger="interval",
             seconds=self.liveliness_probe_s,
+            id=f"liveliness-{id(self)}",
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=self.liveliness_probe_s
         )
-        self.scheduler.start()
+
+    @classmethod
+    def _start_scheduler(cls) -> None:
+        """
+        Starts the shared scheduler the first time a syncer is created, and shuts it down when the process exits.
+        """
+        with cls._scheduler_lock:
+            if not cls.scheduler.running:
+                cls.scheduler.start()
+                atexit.register(cls._shutdown_scheduler)
+
+    @classmethod
+    def _shutdown_scheduler(cls) -> None:
+        with cls._scheduler_lock:
+            if cls.scheduler.running:
+                cls.scheduler.shutdown(wait=False)
+
+    @classmethod
+    def _reset_scheduler_after_fork(cls) -> None:
+        """
+        A forked child inherits the shared scheduler marked as running, but not its thread, so jobs added in the child
+        would never run. The child gets a fresh scheduler instead, started by the first syncer created in it.
+        """
+        cls._scheduler_lock = Lock()
+        cls.scheduler = BackgroundScheduler()
 
     def is_alive(
             self,
             current_timestamp_ms: int
-    ):
+    ) -> bool:
         """
         The syncer, and by extension its Snowfall instance, is alive iff its generator id is still reserved.
         """
-        ms_since_last_updated = current_timestamp_ms - self._last_alive_ms
-        if ms_since_last_updated <= self.ms_to_release_generator_id:
-            return True
-        else:
-            return False
+        return current_timestamp_ms - self._last_alive_ms <= self.ms_to_release_generator_id
+
+    def add_generator_id_listener(
+            self,
+            listener: Callable[[int], None]
+    ) -> None:
+        """
+        Registers a callback that is passed the new generator id whenever this syncer has to reclaim one.
+        """
+        self._generator_id_listeners.append(listener)
+
+    def _reclaim_generator_id(self) -> None:
+        """
+        Claims another generator id after the current one was claimed by another Snowfall instance. The syncer reports
+        itself as not alive until every listener has been passed the new generator id, so that no GUIDs are composed
+        with the old one in the meantime.
+        """
+        logging.warning("Generator id claimed by another Snowfall instance, claiming another id")
+        self._last_alive_ms = 0
+        generator_id = self._claim_generator_id()
+        last_alive_ms, self._last_alive_ms = self._last_alive_ms, 0
+
+        self._generator_id = generator_id
+        for listener in self._generator_id_listeners:
+            listener(generator_id)
+        self._last_alive_ms = last_alive_ms
 
     def update_liveliness_job(self):
         self._set_liveliness(
@@ -88,3 +150,7 @@ class BaseSyncer(ABC):
 
     ) -> None:
         raise NotImplementedError
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=BaseSyncer._reset_scheduler_after_fork)
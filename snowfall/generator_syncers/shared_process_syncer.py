@@ -0,0 +1,242 @@
+from datetime import datetime
+from contextlib import contextmanager
+from tempfile import gettempdir
+from typing import Iterator
+from apscheduler.jobstores.base import JobLookupError
+import os
+import sys
+import numpy as np
+
+from snowfall.generator_syncers.abstracts import BaseSyncer
+from snowfall.generator_syncers.simple_syncer import find_first_released_id
+from snowfall.utils import get_current_timestamp_ms
+
+try:
+    import fcntl
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    SharedMemory = None
+
+
+class SharedProcessSyncer(BaseSyncer):
+
+    # The shared memory block holds a header of schema group properties, followed by the manifest.
+    LIVELINESS_PROBE_S_INDEX = 0
+    EPOCH_START_MS_INDEX = 1
+    HEADER_SIZE = 2
+
+    def __init__(
+            self,
+            schema_group_name: str = "default"
+    ):
+        """
+        A SharedProcessSyncer instance that reserves a generator_id for its associated Snowfall instance. The manifest
+        is kept in shared memory, so that Snowfall instances in different processes on the same machine never reserve
+        the same generator_id.
+        :param schema_group_name: The schema group we want to associate this SharedProcessSyncer with.
+        """
+        self._raise_if_unsupported()
+        try:
+            self._shared_memory = self._attach_shared_memory(schema_group_name=schema_group_name)
+        except FileNotFoundError:
+            raise KeyError(f"No such schema group found: {schema_group_name}. Call `create_schema_group` first.")
+        block = self._as_array(shared_memory=self._shared_memory)
+        self._manifest = block[self.HEADER_SIZE:]
+        self._lock_file = open(self._get_lock_path(schema_group_name=schema_group_name), "a")
+
+        self._liveliness_probe_s = int(block[self.LIVELINESS_PROBE_S_INDEX])
+        self._ms_to_release_generator_id = self._liveliness_probe_s * 1000 * self.PROBE_MISSES_TO_RELEASE
+        self._epoch_start_ms = int(block[self.EPOCH_START_MS_INDEX])
+        super().__init__()
+
+    @property
+    def liveliness_probe_s(self) -> int:
+        return self._liveliness_probe_s
+
+    @property
+    def ms_to_release_generator_id(self) -> int:
+        return self._ms_to_release_generator_id
+
+    @property
+    def generator_id(self) -> int:
+        return self._generator_id
+
+    @property
+    def last_alive_ms(self) -> int:
+        return self._last_alive_ms
+
+    @property
+    def epoch_start_ms(self) -> int:
+        return self._epoch_start_ms
+
+    @classmethod
+    def create_schema_group(
+            cls,
+            schema_group_name: str = "default",
+            liveliness_probe_s: int = 5,
+            epoch_start_date: datetime = datetime(2020, 1, 1)
+    ) -> None:
+        """
+        Adds a schema group to the machine's shared memory. It outlives the process that created it, until it is
+        removed with `delete_schema_group`.
+        :param schema_group_name:  Unique name that identifies the schema group.
+        :param liveliness_probe_s: Frequency with which the SharedProcessSyncer instances update their liveliness
+                                    in the manifest.
+        :param epoch_start_date:   GUIDs are unique for up to 2^41ms (~70 years) from the epoch start date.
+        """
+        cls._raise_if_unsupported()
+        if epoch_start_date > datetime.utcnow():
+            raise ValueError(f"epoch_start_date: {epoch_start_date} cannot be in the future of the current UTC time.")
+
+        try:
+            shared_memory = cls._open_untracked_shared_memory(
+                name=cls._get_shared_memory_name(schema_group_name=schema_group_name),
+                create=True,
+                size=np.dtype(np.int64).itemsize * (cls.HEADER_SIZE + cls.MAX_GENERATOR_ID + 1)
+            )
+        except FileExistsError:
+            raise ValueError(f"schema_group_name: {schema_group_name} already exists.")
+
+        block = cls._as_array(shared_memory=shared_memory)
+        block[:] = 0
+        block[cls.LIVELINESS_PROBE_S_INDEX] = liveliness_probe_s
+        block[cls.EPOCH_START_MS_INDEX] = int(epoch_start_date.timestamp() * 1000)
+        del block
+        shared_memory.close()
+
+    @classmethod
+    def delete_schema_group(
+            cls,
+            schema_group_name: str = "default"
+    ) -> None:
+        """
+        Removes a schema group from the machine's shared memory. Processes already attached to it keep their mapping,
+        but new SharedProcessSyncers can no longer join it.
+        """
+        cls._raise_if_unsupported()
+        shared_memory = SharedMemory(name=cls._get_shared_memory_name(schema_group_name=schema_group_name))
+        shared_memory.close()
+        shared_memory.unlink()
+
+    @staticmethod
+    def _raise_if_unsupported() -> None:
+        if SharedMemory is None:
+            raise RuntimeError("SharedProcessSyncer requires Python 3.8+ on a POSIX system.")
+
+    @staticmethod
+    def _get_shared_memory_name(
+            schema_group_name: str
+    ) -> str:
+        return f"snowfall_{schema_group_name}"
+
+    @classmethod
+    def _get_lock_path(
+            cls,
+            schema_group_name: str
+    ) -> str:
+        return os.path.join(gettempdir(), f"{cls._get_shared_memory_name(schema_group_name=schema_group_name)}.lock")
+
+    @classmethod
+    def _attach_shared_memory(
+            cls,
+            schema_group_name: str
+    ) -> "SharedMemory":
+        return cls._open_untracked_shared_memory(
+            name=cls._get_shared_memory_name(schema_group_name=schema_group_name)
+        )
+
+    @staticmethod
+    def _open_untracked_shared_memory(**kwargs) -> "SharedMemory":
+        """
+        By default, every process that opens a shared memory block registers it with the resource tracker, which
+        unlinks the block when that process exits. Schema groups must outlive the processes that use them, so blocks
+        are opened with track=False from Python 3.13, and unregistered straight after opening before that.
+        """
+        if sys.version_info >= (3, 13):
+            return SharedMemory(track=False, **kwargs)
+
+        shared_memory = SharedMemory(**kwargs)
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+        return shared_memory
+
+    @classmethod
+    def _as_array(
+            cls,
+            shared_memory: "SharedMemory"
+    ) -> np.ndarray:
+        return np.ndarray(
+            shape=(cls.HEADER_SIZE + cls.MAX_GENERATOR_ID + 1,),
+            dtype=np.int64,
+            buffer=shared_memory.buf
+        )
+
+    @contextmanager
+    def _manifest_lock(self) -> Iterator[None]:
+        """
+        An exclusive lock on the manifest, held across all processes on the machine.
+        """
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _claim_generator_id(self) -> int:
+        """
+        Finds all the generator ids which have not been reserved in the past PROBE_MISSES_TO_RELEASE liveliness
+        checks, and then claims the first such generator id as reserved. The manifest lock is held from the scan to
+        the write, so that concurrent processes never claim the same generator id.
+        """
+        with self._manifest_lock():
+            current_timestamp_ms = get_current_timestamp_ms()
+            generator_id = find_first_released_id(
+                self._manifest,
+                current_timestamp_ms - self._ms_to_release_generator_id
+            )
+
+            if generator_id < 0:
+                raise OverflowError("All available generator ids are in use.")
+            self._manifest[generator_id] = current_timestamp_ms
+            self._last_alive_ms = current_timestamp_ms
+
+        return generator_id
+
+    def _set_liveliness(
+            self,
+            current_timestamp_ms: int,
+            generator_id: int
+    ) -> None:
+        """
+        Writes the latest timestamp at which the Snowfall instance is alive to the manifest. If another process has
+        claimed the generator id since the last update, claims another generator id instead.
+        """
+        with self._manifest_lock():
+            is_still_reserved = self._manifest[generator_id] == self._last_alive_ms
+            if is_still_reserved:
+                self._manifest[generator_id] = current_timestamp_ms
+                self._last_alive_ms = current_timestamp_ms
+
+        if not is_still_reserved:
+            self._reclaim_generator_id()
+
+    def close(self) -> None:
+        """
+        Stops the liveliness updates of this syncer and releases its generator id, then closes its lock file and its
+        view of the shared memory block. The schema group itself is left in place.
+        """
+        if self._lock_file.closed:
+            return
+        try:
+            self.scheduler.remove_job(job_id=f"liveliness-{id(self)}")
+        except JobLookupError:
+            pass
+
+        with self._manifest_lock():
+            if self._manifest[self._generator_id] == self._last_alive_ms:
+                self._manifest[self._generator_id] = 0
+            self._last_alive_ms = 0
+
+        self._lock_file.close()
+        del self._manifest
+        self._shared_memory.close()
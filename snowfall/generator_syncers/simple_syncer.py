@@ -1,5 +1,6 @@
 from datetime import datetime
 from collections import namedtuple
+from threading import Lock
 import numpy as np
 
 from snowfall.generator_syncers.abstracts import BaseSyncer
@@ -8,7 +9,7 @@ from snowfall.utils import get_current_timestamp_ms
 
 SchemaGroup = namedtuple(
         typename="SchemaGroup",
-        field_names=("liveliness_probe_s", "epoch_start_ms", "manifest")
+        field_names=("liveliness_probe_s", "epoch_start_ms", "manifest", "lock")
 )
 
 
@@ -29,6 +30,7 @@ class SimpleSyncer(BaseSyncer):
         if schema_group is None:
             raise KeyError(f"No such schema group found: {schema_group_name}. Call `create_schema_group` first.")
         self._manifest = schema_group.manifest
+        self._manifest_lock = schema_group.lock
 
         self._liveliness_probe_s = schema_group.liveliness_probe_s
         self._ms_to_release_generator_id = self._liveliness_probe_s * 1000 * self.PROBE_MISSES_TO_RELEASE
@@ -77,31 +79,32 @@ class SimpleSyncer(BaseSyncer):
         else:
             manifest = np.zeros(
                 shape=(cls.MAX_GENERATOR_ID + 1),
-                dtype=int
+                dtype=np.int64
             )
             cls.schema_groups[schema_group_name] = SchemaGroup(
                 liveliness_probe_s=liveliness_probe_s,
-                epoch_start_ms=epoch_start_date.timestamp(),
-                manifest=manifest
+                epoch_start_ms=int(epoch_start_date.timestamp() * 1000),
+                manifest=manifest,
+                lock=Lock()
             )
 
     def _claim_generator_id(self) -> int:
         """
         Finds all the generator ids which have not been reserved in the past PROBE_MISSES_TO_RELEASE liveliness
-        checks, and then claims the first such generator id as reserved.
+        checks, and then claims the first such generator id as reserved. The schema group's lock is held from the scan
+        to the write, so that concurrent threads never claim the same generator id.
         """
-        current_timestamp_ms = get_current_timestamp_ms()
-        ms_since_last_committed_update = current_timestamp_ms - self._manifest
-        released_ids = np.nonzero(ms_since_last_committed_update > self._ms_to_release_generator_id)[0]
-
-        if len(released_ids) > 0:
-            generator_id = released_ids[0]
-            self._set_liveliness(
-                current_timestamp_ms=current_timestamp_ms,
-                generator_id=generator_id
+        with self._manifest_lock:
+            current_timestamp_ms = get_current_timestamp_ms()
+            generator_id = find_first_released_id(
+                self._manifest,
+                current_timestamp_ms - self._ms_to_release_generator_id
             )
-        else:
-            raise OverflowError("All available generator ids are in use.")
+
+            if generator_id < 0:
+                raise OverflowError("All available generator ids are in use.")
+            self._manifest[generator_id] = current_timestamp_ms
+            self._last_alive_ms = current_timestamp_ms
 
         return generator_id
 
@@ -115,3 +118,15 @@ class SimpleSyncer(BaseSyncer):
         """
         self._manifest[generator_id] = current_timestamp_ms
         self._last_alive_ms = current_timestamp_ms
+
+
+def find_first_released_id(
+        manifest: np.ndarray,
+        release_threshold_ms: int
+) -> int:
+    """
+    Returns the first generator id last updated before the release threshold, or -1 if all are in use.
+    """
+    is_released = manifest < release_threshold_ms
+    generator_id = int(is_released.argmax())
+    return generator_id if is_released[generator_id] else -1
@@ -0,0 +1,55 @@
+from typing import Optional
+from threading import Lock
+
+# Mirrors the GUID spec in snowfall.main.Snowfall.
+OFFSET_FOR_LOOPING_COUNT = 12
+OFFSET_FOR_MS_SINCE_EPOCH = 23
+
+
+class LoopingCountShard:
+
+    def __init__(
+            self,
+            generator_id: int,
+            first_looping_count: int,
+            looping_counts_per_shard: int
+    ):
+        """
+        A contiguous slice of the looping count range, with its own counter state and lock. compose_guid draws the
+        next looping count from the shard and returns the resulting GUID, or None if the shard is exhausted for that
+        ms. snowfall._snowfall_core provides a compiled drop-in replacement, used when it has been built.
+        :param generator_id:             The generator_id of the Snowfall instance this shard belongs to. It is
+                                         updated in place if the generator syncer has to reclaim a generator_id.
+        :param first_looping_count:      The first looping count in this shard.
+        :param looping_counts_per_shard: The number of looping counts in this shard.
+        """
+        self.lock = Lock()
+        self.looping_counter = 0
+        self.guid_last_generated_at = -1
+        self.generator_id = generator_id
+        self.first_looping_count = first_looping_count
+        self.max_looping_count = looping_counts_per_shard - 1
+
+    def compose_guid(
+            self,
+            ms_since_epoch: int
+    ) -> Optional[int]:
+        """
+        Increments the looping count, then combines the ms_since_epoch, looping_count, and generator_id according to
+        the Snowfall GUID spec. If the looping count is exhausted within a single ms, returns None and leaves the
+        state untouched so the caller can throttle until the next ms. Raises ValueError for a negative ms_since_epoch,
+        which has no GUID.
+        """
+        if ms_since_epoch < 0:
+            raise ValueError(f"ms_since_epoch: {ms_since_epoch} cannot be negative.")
+        elif self.guid_last_generated_at != ms_since_epoch:
+            self.guid_last_generated_at = ms_since_epoch
+            self.looping_counter = 0
+        elif self.looping_counter < self.max_looping_count:
+            self.looping_counter += 1
+        else:
+            return None
+
+        ms_since_epoch_part = ms_since_epoch << OFFSET_FOR_MS_SINCE_EPOCH
+        looping_count_part = (self.first_looping_count + self.looping_counter) << OFFSET_FOR_LOOPING_COUNT
+        return ms_since_epoch_part | looping_count_part | self.generator_id
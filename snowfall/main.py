@@ -1,11 +1,19 @@
 from typing import Type
-from datetime import datetime, timedelta
+from datetime import timedelta
+from itertools import count
+from threading import local
 from time import sleep
 import logging
+import numpy as np
 
 from snowfall.generator_syncers import BaseSyncer, SimpleSyncer
 from snowfall.utils import get_current_timestamp_ms
 
+try:
+    from snowfall._snowfall_core import LoopingCountShard
+except ImportError:
+    from snowfall.looping_count_shard import LoopingCountShard
+
 
 class Snowfall:
 
@@ -24,74 +32,178 @@ class Snowfall:
     def __init__(
             self,
             generator_syncer_type: Type[BaseSyncer] = SimpleSyncer,
+            thread_shards: int = 1,
             **kwargs
     ):
         """
-        A Snowfall object that generates GUIDs.
+        A thread-safe Snowfall object that generates GUIDs.
         :param generator_syncer_type: Specify a IDSyncer class. An IDSyncer instance will be created to coordinate
                                  the generator_id and epoch_start across multiple Snowfall instances.
+        :param thread_shards:    Splits the looping count range evenly into this many shards, each with its own
+                                 counter and lock. Threads are assigned shards round robin, so up to thread_shards
+                                 threads generate GUIDs without contending, each at up to 2048 / thread_shards GUIDs
+                                 per ms.
         """
+        if not 1 <= thread_shards <= self.MAX_LOOPING_COUNT + 1:
+            raise ValueError(f"thread_shards: {thread_shards} must be within [1, {self.MAX_LOOPING_COUNT + 1}].")
+
         self.generator_syncer = generator_syncer_type(**kwargs)
-        self.generator_id = self.generator_syncer.generator_id
-        self.EPOCH_START_MS = int(self.generator_syncer.epoch_start_ms * 1000)
-        self.looping_counter = 0
-        self.guid_last_generated_at = self.EPOCH_START_MS
+        self.generator_id = int(self.generator_syncer.generator_id)
+        self.EPOCH_START_MS = int(self.generator_syncer.epoch_start_ms)
+
+        looping_counts_per_shard = (self.MAX_LOOPING_COUNT + 1) // thread_shards
+        self._shards = [
+            LoopingCountShard(
+                generator_id=self.generator_id,
+                first_looping_count=i * looping_counts_per_shard,
+                looping_counts_per_shard=looping_counts_per_shard
+            )
+            for i in range(thread_shards)
+        ]
+        self._shard_assignments = count()
+        self._thread_local = local()
+        self.generator_syncer.add_generator_id_listener(self._set_generator_id)
 
     def get_guid(self) -> int:
         """
         :return: A valid Snowfall GUID
         """
-        ms_since_epoch = self._get_ms_since_epoch()
-        self._increment_looping_count(ms_since_epoch=ms_since_epoch)
-        guid = self._combine_into_guid(ms_since_epoch=ms_since_epoch)
+        shard = self._get_shard()
+        generator_syncer = self.generator_syncer
+        epoch_start_ms = self.EPOCH_START_MS
+        max_ms_since_epoch = self.MAX_MS_SINCE_EPOCH
+        compose = shard.compose_guid
+
+        with shard.lock:
+            current_timestamp_ms = get_current_timestamp_ms()
+            while True:
+                ms_since_epoch = current_timestamp_ms - epoch_start_ms
+                if not generator_syncer.is_alive(current_timestamp_ms=current_timestamp_ms):
+                    current_timestamp_ms = self._wait_for_generator_id(current_timestamp_ms=current_timestamp_ms)
+                    continue
+                elif ms_since_epoch > max_ms_since_epoch:
+                    raise OverflowError(f"ms_since_epoch: {ms_since_epoch}, it has been >2^41ms since epoch_start.")
+                elif ms_since_epoch < 0:
+                    raise ValueError(f"ms_since_epoch: {ms_since_epoch}, epoch_start is after the current time.")
+
+                guid = compose(ms_since_epoch)
+                if guid is not None:
+                    break
+                current_timestamp_ms = self._throttle_until_next_ms(current_timestamp_ms=current_timestamp_ms)
         return guid
 
-    def _get_ms_since_epoch(self) -> int:
+    def get_guids(
+            self,
+            n: int
+    ) -> np.ndarray:
         """
-        41 bit integer representing the number of ms since a user-definable epoch start.
+        Generates GUIDs in bulk. The clock is read once per ms rather than once per GUID, and each ms worth of
+        looping counts is combined into GUIDs in a single vectorized operation.
+        :param n: The number of GUIDs to generate.
+        :return: A uint64 array of n valid Snowfall GUIDs, in increasing order.
         """
-        current_timestamp_ms = get_current_timestamp_ms()
-        ms_since_epoch = current_timestamp_ms - self.EPOCH_START_MS
+        shard = self._get_shard()
+        guids = np.empty(n, dtype=np.uint64)
+        offset_for_looping_count = np.uint64(self.OFFSET_FOR_LOOPING_COUNT)
+        n_filled = 0
 
+        with shard.lock:
+            current_timestamp_ms = get_current_timestamp_ms()
+            while n_filled < n:
+                ms_since_epoch = self._get_ms_since_epoch(current_timestamp_ms=current_timestamp_ms)
+                if shard.guid_last_generated_at != ms_since_epoch:
+                    first_looping_count = 0
+                else:
+                    first_looping_count = shard.looping_counter + 1
+
+                n_to_take = min(shard.max_looping_count + 1 - first_looping_count, n - n_filled)
+                if n_to_take <= 0:
+                    current_timestamp_ms = self._throttle_until_next_ms(current_timestamp_ms=current_timestamp_ms)
+                    continue
+
+                looping_counts = np.arange(first_looping_count, first_looping_count + n_to_take, dtype=np.uint64)
+                looping_counts += np.uint64(shard.first_looping_count)
+                guid_prefix = np.uint64((ms_since_epoch << self.OFFSET_FOR_MS_SINCE_EPOCH) | shard.generator_id)
+                guids[n_filled:n_filled + n_to_take] = (looping_counts << offset_for_looping_count) | guid_prefix
+
+                n_filled += n_to_take
+                shard.guid_last_generated_at = ms_since_epoch
+                shard.looping_counter = first_looping_count + n_to_take - 1
+        return guids
+
+    def _set_generator_id(
+            self,
+            generator_id: int
+    ) -> None:
+        """
+        Switches the shards over to the generator id the syncer reclaimed. The syncer is not alive while this runs, so
+        no shard is composing GUIDs in the meantime.
+        """
+        self.generator_id = generator_id
+        for shard in self._shards:
+            shard.generator_id = generator_id
+
+    def _get_shard(self) -> "LoopingCountShard":
+        """
+        The shard of the looping count range assigned to the calling thread.
+        """
+        try:
+            return self._thread_local.shard
+        except AttributeError:
+            shard = self._thread_local.shard = self._shards[next(self._shard_assignments) % len(self._shards)]
+            return shard
+
+    def _get_ms_since_epoch(
+            self,
+            current_timestamp_ms: int
+    ) -> int:
+        """
+        41 bit integer representing the number of ms since a user-definable epoch start.
+        """
         if not self.generator_syncer.is_alive(current_timestamp_ms=current_timestamp_ms):
-            logging.warning("Generator ID no longer reserved by this instance.")
-            timeout_start = datetime.now()
-            while not self.generator_syncer.is_alive(current_timestamp_ms=current_timestamp_ms):
-                sleep(1)
-                logging.info("Waiting 1 sec for the liveliness update job to claim a generator ID.")
-                if datetime.now() - timeout_start > self.TIMEOUT_TO_RECLAIM_GENERATOR_ID_SECS:
-                    raise RuntimeError("Failed to claim a generator ID before timeout.")
-        elif ms_since_epoch > self.MAX_MS_SINCE_EPOCH:
+            current_timestamp_ms = self._wait_for_generator_id(current_timestamp_ms=current_timestamp_ms)
+
+        ms_since_epoch = current_timestamp_ms - self.EPOCH_START_MS
+        if ms_since_epoch > self.MAX_MS_SINCE_EPOCH:
             raise OverflowError(f"ms_since_epoch: {ms_since_epoch}, it has been >2^41ms since epoch_start.")
+        elif ms_since_epoch < 0:
+            raise ValueError(f"ms_since_epoch: {ms_since_epoch}, epoch_start is after the current time.")
 
         return ms_since_epoch
 
-    def _increment_looping_count(
+    def _wait_for_generator_id(
             self,
-            ms_since_epoch: int
+            current_timestamp_ms: int
     ) -> int:
         """
-        An auto-incrementing count that loops within the range [0, 2048). If the count >= 2048 within a single ms,
-        throttle the output until the next ms to ensure GUID stays unique.
+        Blocks until the liveliness update job has reclaimed a generator ID for this instance. The timeout is kept on
+        the same ms clock that liveliness is checked against.
+        :return: The current timestamp, as last read from the clock while waiting.
         """
-        if self.guid_last_generated_at != ms_since_epoch:
-            self.looping_counter = 0
-        else:
-            if self.looping_counter > self.MAX_LOOPING_COUNT:
-                s_until_next_ms = (ms_since_epoch + 1) / 1000 - datetime.utcnow().timestamp()
-                sleep(secs=max(s_until_next_ms, 0))
-            self.looping_counter += 1
-        return self.looping_counter
+        logging.warning("Generator ID no longer reserved by this instance.")
+        timeout_at_ms = current_timestamp_ms + self.TIMEOUT_TO_RECLAIM_GENERATOR_ID_SECS // timedelta(milliseconds=1)
+        while not self.generator_syncer.is_alive(current_timestamp_ms=current_timestamp_ms):
+            sleep(1)
+            logging.info("Waiting 1 sec for the liveliness update job to claim a generator ID.")
+            current_timestamp_ms = get_current_timestamp_ms()
+            if current_timestamp_ms > timeout_at_ms:
+                raise RuntimeError("Failed to claim a generator ID before timeout.")
+        return current_timestamp_ms
 
-    def _combine_into_guid(
-            self,
-            ms_since_epoch: int
+    @staticmethod
+    def _throttle_until_next_ms(
+            current_timestamp_ms: int
     ) -> int:
         """
-        Combines the ms_since_epoch, looping_count, and generator_id according to the Snowfall GUID spec.
+        The looping count loops within the range [0, 2048). If the count is exhausted within a single ms, throttle the
+        output until the next ms to ensure GUID stays unique. The wait is always under 1ms, well below the scheduling
+        slack of sleep(), so we spin on the clock instead. Each pass yields the GIL with sleep(0), so that threads
+        drawing on other shards are not stalled by the spin.
+        :return: The timestamp of the next ms, as last read from the clock while spinning.
         """
-        ms_since_epoch_part = ms_since_epoch << self.OFFSET_FOR_MS_SINCE_EPOCH
-        looping_count_part = self.looping_counter << self.OFFSET_FOR_LOOPING_COUNT
-        guid = ms_since_epoch_part + looping_count_part + self.generator_id
-        self.guid_last_generated_at = ms_since_epoch
-        return guid
+        next_timestamp_ms = current_timestamp_ms + 1
+        while current_timestamp_ms < next_timestamp_ms:
+            sleep(0)
+            current_timestamp_ms = get_current_timestamp_ms()
+        return current_timestamp_ms
+
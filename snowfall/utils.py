@@ -1,5 +1,5 @@
-from datetime import datetime
+from time import time_ns
 
 
 def get_current_timestamp_ms() -> int:
-    return int(datetime.utcnow().timestamp() * 1000)
+    return time_ns() // 1_000_000
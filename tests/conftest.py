@@ -0,0 +1,71 @@
+from typing import Callable
+from uuid import uuid4
+import os
+import pytest
+
+from snowfall import Snowfall
+from snowfall.generator_syncers import SimpleSyncer
+from snowfall.utils import get_current_timestamp_ms
+
+
+class FrozenClock:
+
+    def __init__(self):
+        """
+        Stands in for the ms clock read by Snowfall. The clock only moves forward when Snowfall throttles, so that
+        saturating the looping count within one ms is deterministic.
+        """
+        self.timestamp_ms = get_current_timestamp_ms()
+        self.throttles = 0
+
+    def get_current_timestamp_ms(self) -> int:
+        return self.timestamp_ms
+
+    def throttle_until_next_ms(
+            self,
+            current_timestamp_ms: int
+    ) -> int:
+        self.throttles += 1
+        self.timestamp_ms = current_timestamp_ms + 1
+        return self.timestamp_ms
+
+
+@pytest.fixture
+def schema_group_name() -> str:
+    return f"test_{uuid4().hex[:16]}"
+
+
+@pytest.fixture
+def simple_schema_group(schema_group_name: str) -> str:
+    SimpleSyncer.create_schema_group(schema_group_name=schema_group_name)
+    yield schema_group_name
+    SimpleSyncer.schema_groups.pop(schema_group_name)
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch) -> FrozenClock:
+    clock = FrozenClock()
+    monkeypatch.setattr("snowfall.main.get_current_timestamp_ms", clock.get_current_timestamp_ms)
+    monkeypatch.setattr(Snowfall, "_throttle_until_next_ms", staticmethod(clock.throttle_until_next_ms))
+    return clock
+
+
+@pytest.fixture
+def run_in_forked_child() -> Callable[[Callable[[], bool]], bool]:
+    """
+    Runs a check in a forked child process, and returns whether it passed.
+    """
+    if not hasattr(os, "fork"):
+        pytest.skip("os.fork is not available on this platform.")
+
+    def run(check: Callable[[], bool]) -> bool:
+        pid = os.fork()
+        if pid == 0:
+            passed = False
+            try:
+                passed = check()
+            finally:
+                os._exit(0 if passed else 1)
+        return os.waitpid(pid, 0)[1] == 0
+
+    return run
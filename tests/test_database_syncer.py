@@ -0,0 +1,132 @@
+from datetime import datetime
+from time import sleep
+import pytest
+
+from snowfall import Snowfall
+from snowfall.generator_syncers import DatabaseSyncer
+
+
+@pytest.fixture
+def engine_url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'snowfall.db'}"
+
+
+@pytest.fixture
+def database_schema_group(schema_group_name: str, engine_url: str) -> str:
+    DatabaseSyncer.create_schema_group(
+        schema_group_name=schema_group_name,
+        liveliness_probe_s=1,
+        epoch_start_date=datetime(2020, 1, 1),
+        engine_url=engine_url
+    )
+    return schema_group_name
+
+
+def test_create_schema_group_stores_properties(database_schema_group, engine_url):
+    syncer = DatabaseSyncer(engine_url=engine_url, schema_group_name=database_schema_group)
+    properties = syncer.get_properties()
+
+    assert properties.liveliness_probe_s == 1
+    assert properties.epoch_start_ms == int(datetime(2020, 1, 1).timestamp() * 1000)
+    assert syncer.epoch_start_ms == properties.epoch_start_ms
+    assert syncer.ms_to_release_generator_id == 1000 * DatabaseSyncer.PROBE_MISSES_TO_RELEASE
+
+
+def test_create_schema_group_twice_raises(database_schema_group, engine_url):
+    with pytest.raises(RuntimeError):
+        DatabaseSyncer.create_schema_group(schema_group_name=database_schema_group, engine_url=engine_url)
+
+
+def test_generator_ids_are_unique_within_schema_group(database_schema_group, engine_url):
+    id_generators = [
+        Snowfall(generator_syncer_type=DatabaseSyncer, schema_group_name=database_schema_group, engine_url=engine_url)
+        for _ in range(3)
+    ]
+    assert sorted(id_generator.generator_id for id_generator in id_generators) == [0, 1, 2]
+
+    guids = [id_generator.get_guid() for id_generator in id_generators for _ in range(100)]
+    assert len(set(guids)) == len(guids)
+
+
+def test_liveliness_update_keeps_generator_id(database_schema_group, engine_url):
+    syncer = DatabaseSyncer(engine_url=engine_url, schema_group_name=database_schema_group)
+    generator_id, last_alive_ms = syncer.generator_id, syncer.last_alive_ms
+
+    syncer._set_liveliness(current_timestamp_ms=last_alive_ms + 1, generator_id=generator_id)
+    assert syncer.generator_id == generator_id
+    assert syncer.last_alive_ms == last_alive_ms + 1
+
+
+def test_liveliness_update_reclaims_generator_id_claimed_by_another_instance(database_schema_group, engine_url):
+    id_generator = Snowfall(
+        generator_syncer_type=DatabaseSyncer,
+        schema_group_name=database_schema_group,
+        engine_url=engine_url
+    )
+    syncer = id_generator.generator_syncer
+    generator_id = syncer.generator_id
+    with syncer.engine.begin() as connection:
+        connection.execute(
+            syncer.manifest_row_class.__table__.update()
+            .where(syncer.manifest_row_class.generator_id == generator_id)
+            .values(last_updated_ms=0)
+        )
+    sleep(0.01)
+    other_syncer = DatabaseSyncer(engine_url=engine_url, schema_group_name=database_schema_group)
+    assert other_syncer.generator_id == generator_id
+
+    syncer.update_liveliness_job()
+    assert syncer.generator_id != generator_id
+    assert id_generator.generator_id == syncer.generator_id
+    assert id_generator.get_guid() & DatabaseSyncer.MAX_GENERATOR_ID == syncer.generator_id
+
+
+def test_liveliness_job_runs_in_forked_child(database_schema_group, engine_url, run_in_forked_child):
+    DatabaseSyncer(engine_url=engine_url, schema_group_name=database_schema_group)
+
+    def check() -> bool:
+        syncer = DatabaseSyncer(engine_url=engine_url, schema_group_name=database_schema_group)
+        last_alive_ms = syncer.last_alive_ms
+        sleep(1.5)
+        return syncer.last_alive_ms > last_alive_ms
+
+    assert run_in_forked_child(check)
+
+
+def test_epoch_start_long_before_2020(schema_group_name, engine_url):
+    DatabaseSyncer.create_schema_group(
+        schema_group_name=schema_group_name,
+        epoch_start_date=datetime(1971, 1, 1),
+        engine_url=engine_url
+    )
+    id_generator = Snowfall(
+        generator_syncer_type=DatabaseSyncer,
+        schema_group_name=schema_group_name,
+        engine_url=engine_url
+    )
+
+    assert id_generator.EPOCH_START_MS == int(datetime(1971, 1, 1).timestamp() * 1000)
+    assert id_generator.get_guid() > 0
+
+
+def test_legacy_epoch_start_in_fractional_seconds(database_schema_group, engine_url):
+    syncer = DatabaseSyncer(engine_url=engine_url, schema_group_name=database_schema_group)
+    properties = syncer.properties_class.__table__
+    with syncer.engine.begin() as connection:
+        connection.execute(
+            properties.update()
+            .where(properties.c.key == "epoch_start_ms")
+            .values(value=datetime(2020, 1, 1, 0, 0, 0, 500000).timestamp())
+        )
+        connection.execute(properties.delete().where(properties.c.key == DatabaseSyncer.EPOCH_START_IN_MS_KEY))
+    DatabaseSyncer._properties.clear()
+
+    id_generator = Snowfall(
+        generator_syncer_type=DatabaseSyncer,
+        schema_group_name=database_schema_group,
+        engine_url=engine_url
+    )
+    assert id_generator.EPOCH_START_MS == int(datetime(2020, 1, 1, 0, 0, 0, 500000).timestamp() * 1000)
+    assert isinstance(id_generator.generator_syncer.epoch_start_ms, int)
+    assert id_generator.get_guid() > 0
+    assert len(id_generator.get_guids(10)) == 10
@@ -0,0 +1,60 @@
+from time import sleep
+import pytest
+
+from snowfall import Snowfall
+from snowfall.generator_syncers import SharedProcessSyncer
+from snowfall.generator_syncers.shared_process_syncer import SharedMemory
+
+pytestmark = pytest.mark.skipif(SharedMemory is None, reason="SharedProcessSyncer requires Python 3.8+ on POSIX.")
+
+
+@pytest.fixture
+def shared_schema_group(schema_group_name: str) -> str:
+    SharedProcessSyncer.create_schema_group(schema_group_name=schema_group_name, liveliness_probe_s=1)
+    yield schema_group_name
+    SharedProcessSyncer.delete_schema_group(schema_group_name=schema_group_name)
+
+
+def make_snowfall(schema_group_name: str) -> Snowfall:
+    return Snowfall(generator_syncer_type=SharedProcessSyncer, schema_group_name=schema_group_name)
+
+
+def test_generator_ids_are_unique_within_schema_group(shared_schema_group):
+    id_generators = [make_snowfall(shared_schema_group) for _ in range(3)]
+    assert sorted(id_generator.generator_id for id_generator in id_generators) == [0, 1, 2]
+
+    for id_generator in id_generators:
+        id_generator.generator_syncer.close()
+
+
+def test_reclaimed_generator_id_is_used_for_new_guids(shared_schema_group):
+    id_generator = make_snowfall(shared_schema_group)
+    syncer = id_generator.generator_syncer
+    generator_id = id_generator.generator_id
+    syncer._manifest[generator_id] = 0
+    sleep(0.01)
+    other_syncer = SharedProcessSyncer(schema_group_name=shared_schema_group)
+    assert other_syncer.generator_id == generator_id
+
+    syncer.update_liveliness_job()
+    assert syncer.generator_id != generator_id
+    assert id_generator.generator_id == syncer.generator_id
+    assert id_generator.get_guid() & SharedProcessSyncer.MAX_GENERATOR_ID == syncer.generator_id
+    assert int(id_generator.get_guids(1)[0]) & SharedProcessSyncer.MAX_GENERATOR_ID == syncer.generator_id
+
+    syncer.close()
+    other_syncer.close()
+
+
+def test_close_releases_generator_id(shared_schema_group):
+    syncer = SharedProcessSyncer(schema_group_name=shared_schema_group)
+    generator_id = syncer.generator_id
+
+    syncer.close()
+    syncer.close()
+    assert syncer._lock_file.closed
+    assert not syncer.is_alive(current_timestamp_ms=syncer.ms_to_release_generator_id + 1)
+
+    other_syncer = SharedProcessSyncer(schema_group_name=shared_schema_group)
+    assert other_syncer.generator_id == generator_id
+    other_syncer.close()
@@ -0,0 +1,178 @@
+from typing import Tuple
+from time import sleep
+import numpy as np
+import pytest
+
+from snowfall import Snowfall
+from snowfall.generator_syncers import SimpleSyncer
+from snowfall.looping_count_shard import LoopingCountShard
+
+try:
+    from snowfall._snowfall_core import LoopingCountShard as CompiledLoopingCountShard
+except ImportError:
+    CompiledLoopingCountShard = None
+
+LOOPING_COUNTS_PER_MS = Snowfall.MAX_LOOPING_COUNT + 1
+SHARD_TYPES = [
+    LoopingCountShard,
+    pytest.param(
+        CompiledLoopingCountShard,
+        marks=pytest.mark.skipif(CompiledLoopingCountShard is None, reason="The C extension is not built.")
+    )
+]
+
+
+def decompose_guid(guid: int) -> Tuple[int, int, int]:
+    """
+    :return: (ms_since_epoch, looping_count, generator_id)
+    """
+    return (
+        guid >> Snowfall.OFFSET_FOR_MS_SINCE_EPOCH,
+        (guid >> Snowfall.OFFSET_FOR_LOOPING_COUNT) & Snowfall.MAX_LOOPING_COUNT,
+        guid & (2 ** Snowfall.BITS_FOR_GENERATOR_ID - 1)
+    )
+
+
+def test_get_guid_is_unique_and_increasing(simple_schema_group):
+    id_generator = Snowfall(schema_group_name=simple_schema_group)
+    guids = [id_generator.get_guid() for _ in range(3 * LOOPING_COUNTS_PER_MS)]
+
+    assert all(earlier < later for earlier, later in zip(guids, guids[1:]))
+    assert {decompose_guid(guid)[2] for guid in guids} == {id_generator.generator_id}
+
+
+def test_get_guids_is_unique_and_increasing(simple_schema_group):
+    id_generator = Snowfall(schema_group_name=simple_schema_group)
+    guids = np.concatenate([
+        np.array([id_generator.get_guid()], dtype=np.uint64),
+        id_generator.get_guids(3 * LOOPING_COUNTS_PER_MS),
+        np.array([id_generator.get_guid()], dtype=np.uint64)
+    ])
+
+    assert guids.dtype == np.uint64
+    assert np.all(np.diff(guids.astype(object)) > 0)
+
+
+def test_get_guid_throttles_once_looping_count_is_exhausted(simple_schema_group, frozen_clock):
+    id_generator = Snowfall(schema_group_name=simple_schema_group)
+    ms_since_epoch = frozen_clock.timestamp_ms - id_generator.EPOCH_START_MS
+
+    guids = [id_generator.get_guid() for _ in range(LOOPING_COUNTS_PER_MS)]
+    assert frozen_clock.throttles == 0
+    assert [decompose_guid(guid)[:2] for guid in guids] == [
+        (ms_since_epoch, looping_count) for looping_count in range(LOOPING_COUNTS_PER_MS)
+    ]
+
+    guid = id_generator.get_guid()
+    assert frozen_clock.throttles == 1
+    assert decompose_guid(guid)[:2] == (ms_since_epoch + 1, 0)
+
+
+def test_get_guids_throttles_once_looping_count_is_exhausted(simple_schema_group, frozen_clock):
+    id_generator = Snowfall(schema_group_name=simple_schema_group)
+    ms_since_epoch = frozen_clock.timestamp_ms - id_generator.EPOCH_START_MS
+
+    guids = id_generator.get_guids(2 * LOOPING_COUNTS_PER_MS + 1)
+    assert frozen_clock.throttles == 2
+    assert [decompose_guid(int(guid))[:2] for guid in guids] == [
+        (ms_since_epoch + ms, looping_count)
+        for ms in range(3)
+        for looping_count in range(LOOPING_COUNTS_PER_MS)
+    ][:len(guids)]
+
+    guid = id_generator.get_guid()
+    assert frozen_clock.throttles == 2
+    assert decompose_guid(guid)[:2] == (ms_since_epoch + 2, 1)
+
+
+@pytest.mark.parametrize("thread_shards", [1, 2, 3, 4, 5, 7, 2048])
+def test_thread_shards_draw_unique_looping_counts(simple_schema_group, thread_shards):
+    id_generator = Snowfall(schema_group_name=simple_schema_group, thread_shards=thread_shards)
+    looping_counts_per_shard = LOOPING_COUNTS_PER_MS // thread_shards
+    ms_since_epoch = 1
+
+    guids_by_shard = []
+    for shard in id_generator._shards:
+        guids = []
+        guid = shard.compose_guid(ms_since_epoch)
+        while guid is not None:
+            guids.append(guid)
+            guid = shard.compose_guid(ms_since_epoch)
+        assert len(set(guids)) == len(guids) == looping_counts_per_shard
+        guids_by_shard.append(guids)
+
+    all_guids = [guid for guids in guids_by_shard for guid in guids]
+    assert len(set(all_guids)) == len(all_guids)
+    assert all(decompose_guid(guid)[1] < LOOPING_COUNTS_PER_MS for guid in all_guids)
+
+
+def test_get_guids_draws_from_the_shard_of_the_calling_thread(simple_schema_group, frozen_clock):
+    id_generator = Snowfall(schema_group_name=simple_schema_group, thread_shards=3)
+    guids = id_generator.get_guids(2000)
+
+    first_looping_count = id_generator._get_shard().first_looping_count
+    looping_counts_per_shard = LOOPING_COUNTS_PER_MS // 3
+    assert len(set(guids.tolist())) == len(guids)
+    assert {decompose_guid(int(guid))[1] for guid in guids} == set(
+        range(first_looping_count, first_looping_count + looping_counts_per_shard)
+    )
+
+
+def test_epoch_start_after_current_time_raises(simple_schema_group, frozen_clock):
+    id_generator = Snowfall(schema_group_name=simple_schema_group)
+    id_generator.EPOCH_START_MS = frozen_clock.timestamp_ms + 60 * 1000
+
+    with pytest.raises(ValueError):
+        id_generator.get_guid()
+    with pytest.raises(ValueError):
+        id_generator.get_guids(10)
+    assert frozen_clock.throttles == 0
+
+
+@pytest.mark.parametrize("shard_type", SHARD_TYPES)
+def test_shards_compose_identical_guids(shard_type):
+    shard = shard_type(generator_id=5, first_looping_count=682, looping_counts_per_shard=682)
+    python_shard = LoopingCountShard(generator_id=5, first_looping_count=682, looping_counts_per_shard=682)
+
+    for ms_since_epoch in (0, 1, 2 ** 40, Snowfall.MAX_MS_SINCE_EPOCH):
+        guids = [shard.compose_guid(ms_since_epoch) for _ in range(683)]
+        assert guids == [python_shard.compose_guid(ms_since_epoch) for _ in range(683)]
+        assert guids[-1] is None
+
+
+@pytest.mark.parametrize("shard_type", SHARD_TYPES)
+@pytest.mark.parametrize("ms_since_epoch", [-1, -60 * 1000])
+def test_shards_reject_negative_ms_since_epoch(shard_type, ms_since_epoch):
+    shard = shard_type(generator_id=5, first_looping_count=0, looping_counts_per_shard=LOOPING_COUNTS_PER_MS)
+    with pytest.raises(ValueError):
+        shard.compose_guid(ms_since_epoch)
+
+
+def test_thread_shards_must_fit_the_looping_count_range(simple_schema_group):
+    with pytest.raises(ValueError):
+        Snowfall(schema_group_name=simple_schema_group, thread_shards=0)
+    with pytest.raises(ValueError):
+        Snowfall(schema_group_name=simple_schema_group, thread_shards=LOOPING_COUNTS_PER_MS + 1)
+
+
+def test_generator_ids_are_unique_within_schema_group(simple_schema_group):
+    id_generators = [Snowfall(schema_group_name=simple_schema_group) for _ in range(3)]
+    assert len({id_generator.generator_id for id_generator in id_generators}) == 3
+
+
+def test_missing_schema_group_raises():
+    with pytest.raises(KeyError):
+        SimpleSyncer(schema_group_name="missing")
+
+
+def test_liveliness_job_runs_in_forked_child(schema_group_name, run_in_forked_child):
+    SimpleSyncer.create_schema_group(schema_group_name=schema_group_name, liveliness_probe_s=1)
+    Snowfall(schema_group_name=schema_group_name)
+
+    def check() -> bool:
+        syncer = Snowfall(schema_group_name=schema_group_name).generator_syncer
+        last_alive_ms = syncer.last_alive_ms
+        sleep(1.5)
+        return syncer.last_alive_ms > last_alive_ms
+
+    assert run_in_forked_child(check)